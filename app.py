@@ -1,18 +1,142 @@
 import streamlit as st
-import plotly.graph_objects as go
-import pandas as pd
+import plotly.io as pio
 import numpy as np
 
-# Set page config
+# Serialize figures with orjson instead of the stdlib json encoder
+pio.json.config.default_engine = "orjson"
+
+_FOOTER = """
+<div style='text-align: center'>
+    <i>Note: All calculations are based on provided estimates and actual results may vary. 
+    Past performance does not guarantee future results.</i>
+</div>
+"""
+
+# Set page config (widget values land in session state before the rerun,
+# so the layout matches the current sidebar toggle)
 st.set_page_config(
     page_title="Trading Strategy Dashboard",
-    layout="wide",
+    layout=st.session_state.get("layout", "wide"),
     initial_sidebar_state="expanded"
 )
 
+# Initialize per-session state once instead of on every rerun
+if 'initialized' not in st.session_state:
+    st.session_state.initialized = True
+    st.session_state.portfolio_history = []
+    st.session_state.months_arr = np.arange(1, 13, dtype=np.float64)
+
+def fmt_usd(x):
+    return f"${x:,.2f} USD"
+
+def columns(n, layout):
+    # Side-by-side columns on wide screens, stacked containers when centered
+    if layout == "wide":
+        return st.columns(n)
+    return [st.container() for _ in range(n)]
+
+def create_gauge(value, title, steps):
+    return {
+        'data': [{
+            'type': "indicator",
+            'mode': "gauge+number",
+            'value': value,
+            'title': {'text': title},
+            'gauge': {
+                'axis': {'range': [0, 100]},
+                'bar': {'color': "darkblue"},
+                'steps': steps,
+            }
+        }],
+        'layout': {'height': 250, 'transition': {'duration': 0}}
+    }
+
+def render_gauges(best_case, normal_case, worst_case, layout):
+    # Shared by all three gauges, so build it once per rerun
+    gauge_steps = [
+        {'range': [0, worst_case], 'color': "lightgray"},
+        {'range': [worst_case, normal_case], 'color': "gray"},
+        {'range': [normal_case, best_case], 'color': "lightblue"}
+    ]
+    with st.container():
+        col1, col2, col3 = columns(3, layout)
+
+        with col1:
+            st.plotly_chart(
+                create_gauge(best_case, "Best Case Scenario", gauge_steps),
+                use_container_width=True
+            )
+
+        with col2:
+            st.plotly_chart(
+                create_gauge(normal_case, "Normal Case Scenario", gauge_steps),
+                use_container_width=True
+            )
+
+        with col3:
+            st.plotly_chart(
+                create_gauge(worst_case, "Worst Case Scenario", gauge_steps),
+                use_container_width=True
+            )
+
+def compute_projections(months_arr, initial_portfolio, best, normal, worst):
+    # Create monthly projection for different scenarios using linear growth
+    rates = np.array([best, normal, worst], dtype=np.float64) / 100.0
+    proj = initial_portfolio * (1.0 + rates[:, None] * months_arr[None, :])
+    return proj[0], proj[1], proj[2]
+
+def render_projection(initial_portfolio, best_case, normal_case, worst_case):
+    months_arr = st.session_state.months_arr
+    best_proj, normal_proj, worst_proj = compute_projections(
+        months_arr, initial_portfolio, best_case, normal_case, worst_case
+    )
+
+    fig = {
+        'data': [
+            {'type': "scattergl", 'x': months_arr, 'y': best_proj, 'name': "Best Case", 'line': {'color': "green"}},
+            {'type': "scattergl", 'x': months_arr, 'y': normal_proj, 'name': "Normal Case", 'line': {'color': "blue"}},
+            {'type': "scattergl", 'x': months_arr, 'y': worst_proj, 'name': "Worst Case", 'line': {'color': "red"}}
+        ],
+        'layout': {
+            'title': {'text': "12-Month Portfolio Projection (Linear Growth)"},
+            'xaxis': {'title': {'text': "Months"}},
+            'yaxis': {'title': {'text': "Portfolio Value (USD)"}},
+            'hovermode': "x unified",
+            'transition': {'duration': 0}
+        }
+    }
+    st.plotly_chart(fig, use_container_width=True)
+
+def render_risk_analysis(risk_amount, max_loss, remaining_portfolio, max_trades, layout):
+    col1, col2 = columns(2, layout)
+
+    with col1:
+        st.info(f"Maximum Potential Loss (Based on Max DD): {fmt_usd(max_loss)}")
+        st.metric(
+            label="Maximum Number of Simultaneous Trades",
+            value=f"{int(max_trades)}",
+            help="Based on risk per trade"
+        )
+
+    with col2:
+        st.success(f"Remaining Portfolio After Max DD: {fmt_usd(remaining_portfolio)}")
+        st.metric(
+            label="Average Trade Size",
+            value=fmt_usd(risk_amount),
+            help="Suggested position size based on risk parameters"
+        )
+
 # Sidebar controls
 st.sidebar.title("Trading Parameters")
 
+# Layout toggle
+layout = st.sidebar.radio(
+    "Layout",
+    ["wide", "centered"],
+    key="layout",
+    horizontal=True
+)
+
 # Initial portfolio input
 initial_portfolio = st.sidebar.number_input(
     "Initial Portfolio (USD)",
@@ -58,126 +182,46 @@ st.title("Trading Strategy Metrics Dashboard")
 st.markdown("---")
 
 # Key metrics
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    st.metric(
-        label="Initial Portfolio",
-        value=f"${initial_portfolio:,.2f} USD",
-        delta=None
-    )
-
-with col2:
-    st.metric(
-        label="Risk Per Trade",
-        value=f"${risk_amount:,.2f} USD",
-        delta=f"{risk_percentage}%"
-    )
-
-with col3:
-    st.metric(
-        label="Estimated Max Drawdown",
-        value=f"{max_dd}%",
-        delta=f"-${max_loss:,.2f} USD",
-        delta_color="inverse"
-    )
+with st.container():
+    col1, col2, col3 = columns(3, layout)
+
+    with col1:
+        st.metric(
+            label="Initial Portfolio",
+            value=fmt_usd(initial_portfolio),
+            delta=None
+        )
+
+    with col2:
+        st.metric(
+            label="Risk Per Trade",
+            value=fmt_usd(risk_amount),
+            delta=f"{risk_percentage}%"
+        )
+
+    with col3:
+        st.metric(
+            label="Estimated Max Drawdown",
+            value=f"{max_dd}%",
+            delta=f"-{fmt_usd(max_loss)}",
+            delta_color="inverse"
+        )
 
 # Monthly return scenarios with gauge charts
 st.markdown("---")
 st.subheader("Monthly Return Scenarios")
-
-def create_gauge(value, title):
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=value,
-        title={'text': title},
-        gauge={
-            'axis': {'range': [0, 100]},
-            'bar': {'color': "darkblue"},
-            'steps': [
-                {'range': [0, worst_case], 'color': "lightgray"},
-                {'range': [worst_case, normal_case], 'color': "gray"},
-                {'range': [normal_case, best_case], 'color': "lightblue"}
-            ],
-        }
-    ))
-    fig.update_layout(height=250)
-    return fig
-
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    st.plotly_chart(
-        create_gauge(best_case, "Best Case Scenario"),
-        use_container_width=True
-    )
-
-with col2:
-    st.plotly_chart(
-        create_gauge(normal_case, "Normal Case Scenario"),
-        use_container_width=True
-    )
-
-with col3:
-    st.plotly_chart(
-        create_gauge(worst_case, "Worst Case Scenario"),
-        use_container_width=True
-    )
+render_gauges(best_case, normal_case, worst_case, layout)
 
 # Portfolio projection (Linear)
 st.markdown("---")
 st.subheader("Portfolio Projection")
-
-# Create monthly projection for different scenarios using linear growth
-months = range(1, 13)
-best_case_proj = [initial_portfolio * (1 + (best_case/100) * m) for m in months]
-normal_case_proj = [initial_portfolio * (1 + (normal_case/100) * m) for m in months]
-worst_case_proj = [initial_portfolio * (1 + (worst_case/100) * m) for m in months]
-
-fig = go.Figure()
-fig.add_trace(go.Scatter(x=list(months), y=best_case_proj, name="Best Case", line=dict(color="green")))
-fig.add_trace(go.Scatter(x=list(months), y=normal_case_proj, name="Normal Case", line=dict(color="blue")))
-fig.add_trace(go.Scatter(x=list(months), y=worst_case_proj, name="Worst Case", line=dict(color="red")))
-
-fig.update_layout(
-    title="12-Month Portfolio Projection (Linear Growth)",
-    xaxis_title="Months",
-    yaxis_title="Portfolio Value (USD)",
-    hovermode="x unified"
-)
-st.plotly_chart(fig, use_container_width=True)
+render_projection(initial_portfolio, best_case, normal_case, worst_case)
 
 # Risk Analysis
 st.markdown("---")
 st.subheader("Portfolio Risk Analysis")
-
-col1, col2 = st.columns(2)
-
-with col1:
-    st.info(f"Maximum Potential Loss (Based on Max DD): ${max_loss:,.2f} USD")
-    st.metric(
-        label="Maximum Number of Simultaneous Trades",
-        value=f"{int(max_trades)}",
-        help="Based on risk per trade"
-    )
-    
-with col2:
-    st.success(f"Remaining Portfolio After Max DD: ${remaining_portfolio:,.2f} USD")
-    st.metric(
-        label="Average Trade Size",
-        value=f"${initial_portfolio/max_trades:,.2f} USD",
-        help="Suggested position size based on risk parameters"
-    )
+render_risk_analysis(risk_amount, max_loss, remaining_portfolio, max_trades, layout)
 
 # Footer
 st.markdown("---")
-st.markdown("""
-<div style='text-align: center'>
-    <i>Note: All calculations are based on provided estimates and actual results may vary. 
-    Past performance does not guarantee future results.</i>
-</div>
-""", unsafe_allow_html=True)
-
-# Cache the session state
-if 'portfolio_history' not in st.session_state:
-    st.session_state.portfolio_history = []
+st.markdown(_FOOTER, unsafe_allow_html=True)